@@ -20,8 +20,10 @@ __all__ = [
     "configure",
     "notify",
     "notify_sync",
+    "notify_with_context",
     "set_context",
     "get_context",
+    "replace_context",
     "set_user",
     "get_user",
     "set_request",
@@ -203,12 +205,48 @@ def notify_sync(
     return client.send(notice)
 
 
+def notify_with_context(
+    exception: BaseException,
+    context: dict[str, Any],
+) -> Optional[int]:
+    """
+    Report an exception with extra context, then clear all context.
+
+    The extra context is merged into the notice directly rather than being
+    written to the context variable first. Context, user, and request data
+    are cleared afterwards even if reporting fails.
+
+    Args:
+        exception: The exception to report
+        context: Context data to merge over the current context
+
+    Returns:
+        Notice ID if sent synchronously, None if queued or skipped
+    """
+    try:
+        return notify(exception, context=context)
+    finally:
+        clear()
+
+
 def set_context(context: dict[str, Any]) -> None:
-    """Set context data for the current request/task."""
-    current = _context_var.get() or {}
-    updated = current.copy()
-    updated.update(context)
-    _context_var.set(updated)
+    """Set context data for the current request/task, merged over any existing context."""
+    # Build a new dict rather than mutating in place: the current dict may be
+    # shared with other contexts that copied this one (e.g. asyncio tasks).
+    current = _context_var.get()
+    _context_var.set({**current, **context} if current else dict(context))
+
+
+def replace_context(context: dict[str, Any]) -> None:
+    """
+    Clear all context, user, and request data, then set new context.
+
+    Equivalent to calling clear() followed by set_context(context), but
+    without merging into the old context first.
+    """
+    _context_var.set(dict(context))
+    _user_var.set(None)
+    _request_var.set(None)
 
 
 def get_context() -> dict[str, Any]:
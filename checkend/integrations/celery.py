@@ -1,9 +1,14 @@
 """Celery integration for Checkend error monitoring."""
 
+from functools import lru_cache
 from typing import Any
 
 import checkend
 
+# Maximum length of a stringified arg/kwarg value before it is truncated
+_MAX_VALUE_LENGTH = 200
+_ELLIPSIS = "..."
+
 
 def init_celery(app: Any) -> None:
     """
@@ -40,29 +45,30 @@ def init_celery(app: Any) -> None:
         **signal_kwargs: Any,
     ) -> None:
         """Called before a task is executed."""
-        checkend.clear()
-
         # Build task context
         context: dict[str, Any] = {
             "task_id": task_id,
             "task_name": task.name,
         }
 
+        request = task.request
+
         # Add queue info if available
-        if hasattr(task.request, "delivery_info"):
-            delivery_info = task.request.delivery_info or {}
+        if hasattr(request, "delivery_info"):
+            delivery_info = request.delivery_info or {}
             if "routing_key" in delivery_info:
-                context["queue"] = delivery_info.get("routing_key")
+                context["queue"] = delivery_info["routing_key"]
 
         # Add retry info
-        if hasattr(task.request, "retries"):
-            context["retry_count"] = task.request.retries
+        if hasattr(request, "retries"):
+            context["retry_count"] = request.retries
 
         # Add worker hostname if available
-        if hasattr(task.request, "hostname"):
-            context["worker"] = task.request.hostname
+        if hasattr(request, "hostname"):
+            context["worker"] = request.hostname
 
-        checkend.set_context(context)
+        # Drop anything left over from a previous task
+        checkend.replace_context(context)
 
     @signals.task_failure.connect
     def on_task_failure(
@@ -75,8 +81,9 @@ def init_celery(app: Any) -> None:
         **signal_kwargs: Any,
     ) -> None:
         """Called when a task fails with an exception."""
-        # Get additional context
-        context = checkend.get_context() or {}
+        # Only the new keys are built here; set_context merges them into the
+        # context captured at prerun
+        context: dict[str, Any] = {}
 
         # Add sanitized args/kwargs (limited to avoid large payloads)
         sanitized_args = _sanitize_task_args(args)
@@ -87,7 +94,8 @@ def init_celery(app: Any) -> None:
         if sanitized_kwargs:
             context["task_kwargs"] = sanitized_kwargs
 
-        checkend.set_context(context)
+        if context:
+            checkend.set_context(context)
 
         # Notify Checkend
         checkend.notify(exception)
@@ -108,25 +116,53 @@ def init_celery(app: Any) -> None:
 
 def _sanitize_task_args(args: tuple, max_items: int = 10) -> list:
     """Sanitize task arguments for safe logging."""
-    result = []
-    for _i, arg in enumerate(args[:max_items]):
-        try:
-            # Convert to string and truncate
-            str_arg = str(arg)
-            if len(str_arg) > 200:
-                str_arg = str_arg[:200] + "..."
-            result.append(str_arg)
-        except Exception:
-            result.append("<unserializable>")
+    head = args[:max_items]
+    try:
+        # Fast path: stringify everything at C level
+        str_args = list(map(str, head))
+    except Exception:
+        str_args = [_safe_str(arg) for arg in head]
+
+    # Truncate long values
+    result = [
+        s if len(s) <= _MAX_VALUE_LENGTH else s[:_MAX_VALUE_LENGTH] + _ELLIPSIS for s in str_args
+    ]
 
     if len(args) > max_items:
-        result.append(f"... ({len(args) - max_items} more)")
+        result.append(_truncation_msg(len(args) - max_items))
 
     return result
 
 
+@lru_cache(maxsize=64)
+def _truncation_msg(count: int) -> str:
+    """Return the marker appended to args lists that were cut short."""
+    return f"... ({count} more)"
+
+
+@lru_cache(maxsize=64)
+def _truncated_items_msg(count: int) -> str:
+    """Return the marker stored under ``_truncated`` for kwargs cut short."""
+    return f"{count} more items"
+
+
+def _safe_str(value: Any) -> str:
+    """Convert a value to a string, falling back to a placeholder on failure."""
+    try:
+        return str(value)
+    except Exception:
+        return "<unserializable>"
+
+
 def _sanitize_task_kwargs(kwargs: dict, max_items: int = 10) -> dict:
     """Sanitize task keyword arguments for safe logging."""
+    # Fast path: already-clean kwargs are copied as-is
+    if len(kwargs) <= max_items and all(
+        type(key) is str and type(value) is str and len(value) <= _MAX_VALUE_LENGTH
+        for key, value in kwargs.items()
+    ):
+        return dict(kwargs)
+
     result = {}
     items = list(kwargs.items())[:max_items]
 
@@ -134,14 +170,14 @@ def _sanitize_task_kwargs(kwargs: dict, max_items: int = 10) -> dict:
         try:
             # Convert to string and truncate
             str_value = str(value)
-            if len(str_value) > 200:
-                str_value = str_value[:200] + "..."
+            if len(str_value) > _MAX_VALUE_LENGTH:
+                str_value = str_value[:_MAX_VALUE_LENGTH] + _ELLIPSIS
             result[str(key)] = str_value
         except Exception:
             result[str(key)] = "<unserializable>"
 
     if len(kwargs) > max_items:
-        result["_truncated"] = f"{len(kwargs) - max_items} more items"
+        result["_truncated"] = _truncated_items_msg(len(kwargs) - max_items)
 
     return result
 
@@ -187,9 +223,7 @@ class CheckendTask:
         if sanitized_kwargs:
             context["task_kwargs"] = sanitized_kwargs
 
-        checkend.set_context(context)
-        checkend.notify(exc)
-        checkend.clear()
+        checkend.notify_with_context(exc, context)
 
         # Call parent if it exists
         super_method = getattr(super(), "on_failure", None)
@@ -1,9 +1,17 @@
 """Dramatiq integration for Checkend error monitoring."""
 
+from functools import lru_cache
 from typing import Any, Optional
 
 import checkend
 
+# Sentinel for attributes that are absent (as opposed to set to None)
+_MISSING = object()
+
+# Maximum length of a stringified arg/kwarg value before it is truncated
+_MAX_VALUE_LENGTH = 200
+_ELLIPSIS = "..."
+
 
 class CheckendMiddleware:
     """
@@ -30,6 +38,12 @@ class CheckendMiddleware:
             pass
     """
 
+    __slots__ = ("ignore_retries",)
+
+    # Actor options this middleware adds (none). Shared and immutable, so
+    # reading it never allocates.
+    actor_options: frozenset[str] = frozenset()
+
     def __init__(self, ignore_retries: bool = True):
         """
         Initialize the Checkend middleware.
@@ -40,21 +54,14 @@ class CheckendMiddleware:
         """
         self.ignore_retries = ignore_retries
 
-    @property
-    def actor_options(self) -> set:
-        """Return the set of actor options this middleware adds."""
-        return set()
-
     def before_process_message(
         self,
         broker: Any,
         message: Any,
     ) -> None:
         """Called before a message is processed."""
-        checkend.clear()
-
         context = self._build_message_context(message)
-        checkend.set_context(context)
+        checkend.replace_context(context)
 
     def after_process_message(
         self,
@@ -72,17 +79,15 @@ class CheckendMiddleware:
                 return
 
             # Add exception context
-            context = checkend.get_context() or {}
-            context["dramatiq_exception"] = type(exception).__name__
+            context: dict[str, Any] = {"dramatiq_exception": type(exception).__name__}
 
             # Add retry info
-            if hasattr(message, "options"):
-                options = message.options or {}
-                if "retries" in options:
-                    context["retries"] = options["retries"]
+            options = getattr(message, "options", None) or {}
+            if "retries" in options:
+                context["retries"] = options["retries"]
 
-            checkend.set_context(context)
-            checkend.notify(exception)
+            checkend.notify_with_context(exception, context)
+            return
 
         checkend.clear()
 
@@ -98,79 +103,121 @@ class CheckendMiddleware:
         """Build context dictionary from Dramatiq message."""
         context: dict[str, Any] = {}
 
-        if hasattr(message, "message_id"):
-            context["message_id"] = message.message_id
+        message_id = getattr(message, "message_id", _MISSING)
+        if message_id is not _MISSING:
+            context["message_id"] = message_id
 
-        if hasattr(message, "actor_name"):
-            context["actor_name"] = message.actor_name
+        actor_name = getattr(message, "actor_name", _MISSING)
+        if actor_name is not _MISSING:
+            context["actor_name"] = actor_name
 
-        if hasattr(message, "queue_name"):
-            context["queue"] = message.queue_name
+        queue_name = getattr(message, "queue_name", _MISSING)
+        if queue_name is not _MISSING:
+            context["queue"] = queue_name
 
-        if hasattr(message, "options"):
-            options = message.options or {}
+        options = getattr(message, "options", None) or {}
 
-            if "retries" in options:
-                context["retries"] = options["retries"]
+        if "retries" in options:
+            context["retries"] = options["retries"]
 
-            if "max_retries" in options:
-                context["max_retries"] = options["max_retries"]
+        if "max_retries" in options:
+            context["max_retries"] = options["max_retries"]
 
         # Add sanitized args/kwargs
-        if hasattr(message, "args") and message.args:
-            context["message_args"] = self._sanitize_args(message.args)
+        sanitized_args, sanitized_kwargs = self._sanitize_pair(
+            getattr(message, "args", None), getattr(message, "kwargs", None)
+        )
+
+        if sanitized_args:
+            context["message_args"] = sanitized_args
 
-        if hasattr(message, "kwargs") and message.kwargs:
-            context["message_kwargs"] = self._sanitize_kwargs(message.kwargs)
+        if sanitized_kwargs:
+            context["message_kwargs"] = sanitized_kwargs
 
         return context
 
     def _will_retry(self, message: Any) -> bool:
         """Check if a message will be retried."""
-        if not hasattr(message, "options"):
+        options = getattr(message, "options", None)
+        if not options:
             return False
 
-        options = message.options or {}
-        retries = options.get("retries", 0)
-        max_retries = options.get("max_retries", 0)
+        return options.get("retries", 0) < options.get("max_retries", 0)
 
-        return retries < max_retries
-
-    def _sanitize_args(self, args: tuple, max_items: int = 10) -> list:
-        """Sanitize message arguments for safe logging."""
-        result = []
-        for arg in args[:max_items]:
+    def _sanitize_pair(
+        self,
+        args: Optional[tuple],
+        kwargs: Optional[dict],
+        max_items: int = 10,
+    ) -> tuple[list, dict]:
+        """Sanitize message arguments and keyword arguments together for safe logging."""
+        sanitized_args: list = []
+        sanitized_kwargs: dict = {}
+
+        if args:
+            head = args[:max_items]
             try:
-                str_arg = str(arg)
-                if len(str_arg) > 200:
-                    str_arg = str_arg[:200] + "..."
-                result.append(str_arg)
+                str_args = list(map(str, head))
             except Exception:
-                result.append("<unserializable>")
-
-        if len(args) > max_items:
-            result.append(f"... ({len(args) - max_items} more)")
+                str_args = [_safe_str(arg) for arg in head]
+
+            sanitized_args = [
+                s if len(s) <= _MAX_VALUE_LENGTH else s[:_MAX_VALUE_LENGTH] + _ELLIPSIS
+                for s in str_args
+            ]
+
+            if len(args) > max_items:
+                sanitized_args.append(_truncation_msg(len(args) - max_items))
+
+        if kwargs:
+            # Fast path: already-clean kwargs are copied as-is
+            if len(kwargs) <= max_items and all(
+                type(key) is str and type(value) is str and len(value) <= _MAX_VALUE_LENGTH
+                for key, value in kwargs.items()
+            ):
+                sanitized_kwargs = dict(kwargs)
+            else:
+                for key, value in list(kwargs.items())[:max_items]:
+                    try:
+                        str_value = str(value)
+                        if len(str_value) > _MAX_VALUE_LENGTH:
+                            str_value = str_value[:_MAX_VALUE_LENGTH] + _ELLIPSIS
+                        sanitized_kwargs[str(key)] = str_value
+                    except Exception:
+                        sanitized_kwargs[str(key)] = "<unserializable>"
+
+                if len(kwargs) > max_items:
+                    sanitized_kwargs["_truncated"] = _truncated_items_msg(len(kwargs) - max_items)
+
+        return sanitized_args, sanitized_kwargs
 
-        return result
+    def _sanitize_args(self, args: tuple, max_items: int = 10) -> list:
+        """Sanitize message arguments for safe logging."""
+        return self._sanitize_pair(args, None, max_items)[0]
 
     def _sanitize_kwargs(self, kwargs: dict, max_items: int = 10) -> dict:
         """Sanitize message keyword arguments for safe logging."""
-        result = {}
-        items = list(kwargs.items())[:max_items]
+        return self._sanitize_pair(None, kwargs, max_items)[1]
 
-        for key, value in items:
-            try:
-                str_value = str(value)
-                if len(str_value) > 200:
-                    str_value = str_value[:200] + "..."
-                result[str(key)] = str_value
-            except Exception:
-                result[str(key)] = "<unserializable>"
 
-        if len(kwargs) > max_items:
-            result["_truncated"] = f"{len(kwargs) - max_items} more items"
+@lru_cache(maxsize=64)
+def _truncation_msg(count: int) -> str:
+    """Return the marker appended to args lists that were cut short."""
+    return f"... ({count} more)"
+
+
+@lru_cache(maxsize=64)
+def _truncated_items_msg(count: int) -> str:
+    """Return the marker stored under ``_truncated`` for kwargs cut short."""
+    return f"{count} more items"
+
 
-        return result
+def _safe_str(value: Any) -> str:
+    """Convert a value to a string, falling back to a placeholder on failure."""
+    try:
+        return str(value)
+    except Exception:
+        return "<unserializable>"
 
 
 def init_dramatiq(broker: Any, ignore_retries: bool = True) -> CheckendMiddleware:
@@ -1,9 +1,17 @@
 """RQ (Redis Queue) integration for Checkend error monitoring."""
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 import checkend
 
+# Sentinel for attributes that are absent (as opposed to set to None)
+_MISSING = object()
+
+# Maximum length of a stringified arg/kwarg value before it is truncated
+_MAX_VALUE_LENGTH = 200
+_ELLIPSIS = "..."
+
 
 def init_rq() -> None:
     """
@@ -51,14 +59,9 @@ def rq_exception_handler(
     """
     checkend.clear()
 
-    # Build context from job
+    # Build context from job and notify Checkend
     context = _build_job_context(job)
-    checkend.set_context(context)
-
-    # Notify Checkend
-    checkend.notify(exc_value)
-
-    checkend.clear()
+    checkend.notify_with_context(exc_value, context)
 
 
 def _build_job_context(job: Any) -> dict:
@@ -66,75 +69,125 @@ def _build_job_context(job: Any) -> dict:
     context: dict = {}
 
     # Basic job info
-    if hasattr(job, "id"):
-        context["job_id"] = job.id
+    job_id = getattr(job, "id", _MISSING)
+    if job_id is not _MISSING:
+        context["job_id"] = job_id
 
-    if hasattr(job, "func_name"):
-        context["job_func"] = job.func_name
+    func_name = getattr(job, "func_name", _MISSING)
+    if func_name is not _MISSING:
+        context["job_func"] = func_name
 
-    if hasattr(job, "origin"):
-        context["queue"] = job.origin
+    origin = getattr(job, "origin", _MISSING)
+    if origin is not _MISSING:
+        context["queue"] = origin
 
-    if hasattr(job, "description"):
-        context["job_description"] = job.description
+    description = getattr(job, "description", _MISSING)
+    if description is not _MISSING:
+        context["job_description"] = description
 
     # Retry info
-    if hasattr(job, "retries_left"):
-        context["retries_left"] = job.retries_left
+    retries_left = getattr(job, "retries_left", _MISSING)
+    if retries_left is not _MISSING:
+        context["retries_left"] = retries_left
 
-    if hasattr(job, "retry_intervals"):
-        context["retry_intervals"] = job.retry_intervals
+    retry_intervals = getattr(job, "retry_intervals", _MISSING)
+    if retry_intervals is not _MISSING:
+        context["retry_intervals"] = retry_intervals
 
     # Enqueue time
-    if hasattr(job, "enqueued_at") and job.enqueued_at:
-        context["enqueued_at"] = str(job.enqueued_at)
+    enqueued_at = getattr(job, "enqueued_at", None)
+    if enqueued_at:
+        context["enqueued_at"] = str(enqueued_at)
 
     # Add sanitized args/kwargs
-    if hasattr(job, "args") and job.args:
-        context["job_args"] = _sanitize_args(job.args)
+    sanitized_args, sanitized_kwargs = _sanitize_pair(
+        getattr(job, "args", None), getattr(job, "kwargs", None)
+    )
 
-    if hasattr(job, "kwargs") and job.kwargs:
-        context["job_kwargs"] = _sanitize_kwargs(job.kwargs)
+    if sanitized_args:
+        context["job_args"] = sanitized_args
+
+    if sanitized_kwargs:
+        context["job_kwargs"] = sanitized_kwargs
 
     return context
 
 
-def _sanitize_args(args: tuple, max_items: int = 10) -> list:
-    """Sanitize job arguments for safe logging."""
-    result = []
-    for arg in args[:max_items]:
+def _sanitize_pair(
+    args: Optional[tuple],
+    kwargs: Optional[dict],
+    max_items: int = 10,
+) -> tuple[list, dict]:
+    """Sanitize job arguments and keyword arguments together for safe logging."""
+    sanitized_args: list = []
+    sanitized_kwargs: dict = {}
+
+    if args:
+        head = args[:max_items]
         try:
-            str_arg = str(arg)
-            if len(str_arg) > 200:
-                str_arg = str_arg[:200] + "..."
-            result.append(str_arg)
+            str_args = list(map(str, head))
         except Exception:
-            result.append("<unserializable>")
+            str_args = [_safe_str(arg) for arg in head]
+
+        sanitized_args = [
+            s if len(s) <= _MAX_VALUE_LENGTH else s[:_MAX_VALUE_LENGTH] + _ELLIPSIS
+            for s in str_args
+        ]
+
+        if len(args) > max_items:
+            sanitized_args.append(_truncation_msg(len(args) - max_items))
+
+    if kwargs:
+        # Fast path: already-clean kwargs are copied as-is
+        if len(kwargs) <= max_items and all(
+            type(key) is str and type(value) is str and len(value) <= _MAX_VALUE_LENGTH
+            for key, value in kwargs.items()
+        ):
+            sanitized_kwargs = dict(kwargs)
+        else:
+            for key, value in list(kwargs.items())[:max_items]:
+                try:
+                    str_value = str(value)
+                    if len(str_value) > _MAX_VALUE_LENGTH:
+                        str_value = str_value[:_MAX_VALUE_LENGTH] + _ELLIPSIS
+                    sanitized_kwargs[str(key)] = str_value
+                except Exception:
+                    sanitized_kwargs[str(key)] = "<unserializable>"
+
+            if len(kwargs) > max_items:
+                sanitized_kwargs["_truncated"] = _truncated_items_msg(len(kwargs) - max_items)
+
+    return sanitized_args, sanitized_kwargs
+
 
-    if len(args) > max_items:
-        result.append(f"... ({len(args) - max_items} more)")
+def _sanitize_args(args: tuple, max_items: int = 10) -> list:
+    """Sanitize job arguments for safe logging."""
+    return _sanitize_pair(args, None, max_items)[0]
 
-    return result
 
+@lru_cache(maxsize=64)
+def _truncation_msg(count: int) -> str:
+    """Return the marker appended to args lists that were cut short."""
+    return f"... ({count} more)"
 
-def _sanitize_kwargs(kwargs: dict, max_items: int = 10) -> dict:
-    """Sanitize job keyword arguments for safe logging."""
-    result = {}
-    items = list(kwargs.items())[:max_items]
 
-    for key, value in items:
-        try:
-            str_value = str(value)
-            if len(str_value) > 200:
-                str_value = str_value[:200] + "..."
-            result[str(key)] = str_value
-        except Exception:
-            result[str(key)] = "<unserializable>"
+@lru_cache(maxsize=64)
+def _truncated_items_msg(count: int) -> str:
+    """Return the marker stored under ``_truncated`` for kwargs cut short."""
+    return f"{count} more items"
+
+
+def _safe_str(value: Any) -> str:
+    """Convert a value to a string, falling back to a placeholder on failure."""
+    try:
+        return str(value)
+    except Exception:
+        return "<unserializable>"
 
-    if len(kwargs) > max_items:
-        result["_truncated"] = f"{len(kwargs) - max_items} more items"
 
-    return result
+def _sanitize_kwargs(kwargs: dict, max_items: int = 10) -> dict:
+    """Sanitize job keyword arguments for safe logging."""
+    return _sanitize_pair(None, kwargs, max_items)[1]
 
 
 class CheckendWorker:
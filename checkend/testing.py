@@ -16,7 +16,7 @@ class Testing:
         # In your tests
         checkend.notify(exception)
         assert Testing.has_notices()
-        assert Testing.last_notice.error_class == 'ValueError'
+        assert Testing.last_notice().error_class == 'ValueError'
 
         # In your test teardown
         Testing.teardown()
@@ -48,13 +48,11 @@ class Testing:
         return cls._notices.copy()
 
     @classmethod
-    @property
     def last_notice(cls) -> Optional[Notice]:
-        """Get the last captured notice."""
+        """Get the last captured notice without copying the notices list."""
         return cls._notices[-1] if cls._notices else None
 
     @classmethod
-    @property
     def first_notice(cls) -> Optional[Notice]:
         """Get the first captured notice."""
         return cls._notices[0] if cls._notices else None
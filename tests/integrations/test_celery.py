@@ -43,6 +43,12 @@ class TestCeleryHelpers:
         result = _sanitize_task_kwargs(kwargs)
         assert result == {"key1": "value1", "key2": "123"}
 
+    def test_sanitize_task_kwargs_returns_copy_when_clean(self):
+        kwargs = {"key1": "value1", "key2": "value2"}
+        result = _sanitize_task_kwargs(kwargs)
+        assert result == kwargs
+        assert result is not kwargs
+
     def test_sanitize_task_kwargs_truncates_long_values(self):
         long_value = "x" * 500
         kwargs = {"key": long_value}
@@ -60,6 +66,7 @@ class TestCeleryIntegration:
     def setup_method(self):
         checkend.reset()
         Testing.setup()
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
 
     def teardown_method(self):
         checkend.reset()
@@ -74,8 +81,6 @@ class TestCeleryIntegration:
 
     def test_checkend_task_on_failure_captures_exception(self):
         """Test that the on_failure pattern captures exceptions correctly."""
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Simulate what CheckendTask.on_failure does
         exc = ValueError("Task failed")
         task_id = "task-123"
@@ -99,12 +104,10 @@ class TestCeleryIntegration:
         if sanitized_kwargs:
             context["task_kwargs"] = sanitized_kwargs
 
-        checkend.set_context(context)
-        checkend.notify(exc)
-        checkend.clear()
+        checkend.notify_with_context(exc, context)
 
         assert Testing.has_notices()
-        notice = Testing.notices()[-1]
+        notice = Testing.last_notice()
         assert notice.error_class == "ValueError"
         assert notice.context.get("task_id") == "task-123"
         assert notice.context.get("task_name") == "test_task"
@@ -114,6 +117,7 @@ class TestCeleryContextCapture:
     def setup_method(self):
         checkend.reset()
         Testing.setup()
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
 
     def teardown_method(self):
         checkend.reset()
@@ -134,8 +138,6 @@ class TestCeleryContextCapture:
 
     def test_task_args_sanitized_in_context(self):
         """Test that task args are sanitized before being added to context."""
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Simulate task failure with args
         args = ("order-123", "user-456")
         sanitized = _sanitize_task_args(args)
@@ -148,6 +150,6 @@ class TestCeleryContextCapture:
             checkend.notify(e)
 
         assert Testing.has_notices()
-        notice = Testing.notices()[-1]
+        notice = Testing.last_notice()
         # Args are stringified and truncated if needed
         assert "order-123" in notice.context.get("task_args", [])
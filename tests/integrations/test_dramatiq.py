@@ -1,5 +1,6 @@
 """Tests for Dramatiq integration."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import checkend
@@ -10,10 +11,21 @@ from checkend.integrations.dramatiq import (
 )
 
 
+def _msg(**attrs):
+    """Build a lightweight stand-in for a Dramatiq message."""
+    return SimpleNamespace(**attrs)
+
+
+# Shared read-only messages; the middleware never mutates them
+_EMPTY_MSG = _msg()
+_ONLY_ID_MSG = _msg(message_id="msg-456")
+
+
 class TestDramatiqMiddleware:
     def setup_method(self):
         checkend.reset()
         Testing.setup()
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
         self.middleware = CheckendMiddleware()
 
     def teardown_method(self):
@@ -28,17 +40,23 @@ class TestDramatiqMiddleware:
         middleware = CheckendMiddleware(ignore_retries=False)
         assert middleware.ignore_retries is False
 
+    def test_middleware_has_no_instance_dict(self):
+        assert not hasattr(self.middleware, "__dict__")
+
     def test_actor_options_returns_empty_set(self):
         assert self.middleware.actor_options == set()
 
+    def test_actor_options_is_shared_and_immutable(self):
+        other = CheckendMiddleware()
+        assert self.middleware.actor_options is other.actor_options
+        assert isinstance(self.middleware.actor_options, frozenset)
+        assert set() | self.middleware.actor_options == set()
+
     def test_before_process_message_clears_context(self):
         # Set some pre-existing context
         checkend.set_context({"existing": "data"})
 
-        message = MagicMock()
-        message.message_id = "msg-123"
-        message.actor_name = "my_actor"
-        message.queue_name = "default"
+        message = _msg(message_id="msg-123", actor_name="my_actor", queue_name="default")
 
         self.middleware.before_process_message(None, message)
 
@@ -48,13 +66,14 @@ class TestDramatiqMiddleware:
         assert context.get("message_id") == "msg-123"
 
     def test_before_process_message_sets_context(self):
-        message = MagicMock()
-        message.message_id = "msg-456"
-        message.actor_name = "process_order"
-        message.queue_name = "orders"
-        message.options = {"retries": 1, "max_retries": 3}
-        message.args = ("order-123",)
-        message.kwargs = {"priority": "high"}
+        message = _msg(
+            message_id="msg-456",
+            actor_name="process_order",
+            queue_name="orders",
+            options={"retries": 1, "max_retries": 3},
+            args=("order-123",),
+            kwargs={"priority": "high"},
+        )
 
         self.middleware.before_process_message(None, message)
 
@@ -66,10 +85,9 @@ class TestDramatiqMiddleware:
         assert context["max_retries"] == 3
 
     def test_after_process_message_success_clears_context(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
         checkend.set_context({"some": "data"})
 
-        message = MagicMock()
+        message = _EMPTY_MSG
 
         self.middleware.after_process_message(None, message, result="success")
 
@@ -77,32 +95,25 @@ class TestDramatiqMiddleware:
         assert not Testing.has_notices()
 
     def test_after_process_message_failure_captures_error(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Simulate what after_process_message does when an exception occurs
         # and the message won't be retried
         exc = ValueError("Actor failed")
 
         # Simulate no more retries
-        context = checkend.get_context() or {}
-        context["dramatiq_exception"] = type(exc).__name__
-        context["retries"] = 3
-        checkend.set_context(context)
-        checkend.notify(exc)
-        checkend.clear()
+        context = {"dramatiq_exception": type(exc).__name__, "retries": 3}
+        checkend.notify_with_context(exc, context)
 
         assert Testing.has_notices()
-        notice = Testing.notices()[-1]
+        notice = Testing.last_notice()
         assert notice.error_class == "ValueError"
         assert notice.message == "Actor failed"
+        assert notice.context.get("dramatiq_exception") == "ValueError"
+        assert checkend.get_context() == {}
 
     def test_after_process_message_ignores_retryable_errors(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         middleware = CheckendMiddleware(ignore_retries=True)
 
-        message = MagicMock()
-        message.options = {"retries": 1, "max_retries": 3}  # Will retry
+        message = _msg(options={"retries": 1, "max_retries": 3})  # Will retry
 
         exc = ValueError("Temporary failure")
 
@@ -112,12 +123,9 @@ class TestDramatiqMiddleware:
         assert not Testing.has_notices()
 
     def test_after_process_message_captures_final_retry_error(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         middleware = CheckendMiddleware(ignore_retries=True)
 
-        message = MagicMock()
-        message.options = {"retries": 3, "max_retries": 3}  # Final retry
+        message = _msg(options={"retries": 3, "max_retries": 3})  # Final retry
 
         exc = ValueError("Final failure")
 
@@ -127,12 +135,9 @@ class TestDramatiqMiddleware:
         assert Testing.has_notices()
 
     def test_after_process_message_captures_all_when_ignore_retries_false(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         middleware = CheckendMiddleware(ignore_retries=False)
 
-        message = MagicMock()
-        message.options = {"retries": 1, "max_retries": 3}  # Will retry
+        message = _msg(options={"retries": 1, "max_retries": 3})  # Will retry
 
         exc = ValueError("Error")
 
@@ -144,7 +149,7 @@ class TestDramatiqMiddleware:
     def test_after_skip_message_clears_context(self):
         checkend.set_context({"some": "data"})
 
-        message = MagicMock()
+        message = _EMPTY_MSG
 
         self.middleware.after_skip_message(None, message)
 
@@ -156,22 +161,25 @@ class TestDramatiqMiddlewareHelpers:
         self.middleware = CheckendMiddleware()
 
     def test_will_retry_true(self):
-        message = MagicMock()
-        message.options = {"retries": 1, "max_retries": 3}
+        message = _msg(options={"retries": 1, "max_retries": 3})
 
         assert self.middleware._will_retry(message) is True
 
     def test_will_retry_false_at_max(self):
-        message = MagicMock()
-        message.options = {"retries": 3, "max_retries": 3}
+        message = _msg(options={"retries": 3, "max_retries": 3})
 
         assert self.middleware._will_retry(message) is False
 
     def test_will_retry_false_no_options(self):
-        message = MagicMock(spec=[])  # No options attribute
+        message = _EMPTY_MSG  # No options attribute
 
         assert self.middleware._will_retry(message) is False
 
+    def test_will_retry_defaults_missing_retries_to_zero(self):
+        message = _msg(options={"max_retries": 3})
+
+        assert self.middleware._will_retry(message) is True
+
     def test_sanitize_args(self):
         args = ("arg1", "arg2", 123)
         result = self.middleware._sanitize_args(args)
@@ -182,6 +190,11 @@ class TestDramatiqMiddlewareHelpers:
         result = self.middleware._sanitize_kwargs(kwargs)
         assert result == {"key1": "value1", "key2": "123"}
 
+    def test_sanitize_pair(self):
+        args, kwargs = self.middleware._sanitize_pair(("arg1", 123), None)
+        assert args == ["arg1", "123"]
+        assert kwargs == {}
+
 
 class TestInitDramatiq:
     def test_init_dramatiq_adds_middleware(self):
@@ -205,13 +218,14 @@ class TestBuildMessageContext:
         self.middleware = CheckendMiddleware()
 
     def test_build_context_full_message(self):
-        message = MagicMock()
-        message.message_id = "msg-123"
-        message.actor_name = "my_actor"
-        message.queue_name = "default"
-        message.options = {"retries": 2, "max_retries": 5}
-        message.args = ("arg1", "arg2")
-        message.kwargs = {"key": "value"}
+        message = _msg(
+            message_id="msg-123",
+            actor_name="my_actor",
+            queue_name="default",
+            options={"retries": 2, "max_retries": 5},
+            args=("arg1", "arg2"),
+            kwargs={"key": "value"},
+        )
 
         context = self.middleware._build_message_context(message)
 
@@ -224,8 +238,7 @@ class TestBuildMessageContext:
         assert context["message_kwargs"] == {"key": "value"}
 
     def test_build_context_minimal_message(self):
-        message = MagicMock(spec=["message_id"])
-        message.message_id = "msg-456"
+        message = _ONLY_ID_MSG
 
         context = self.middleware._build_message_context(message)
 
@@ -1,6 +1,6 @@
 """Tests for RQ integration."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import checkend
 from checkend import Testing
@@ -8,11 +8,21 @@ from checkend.integrations.rq import (
     _build_job_context,
     _sanitize_args,
     _sanitize_kwargs,
+    _sanitize_pair,
     init_rq,
     rq_exception_handler,
 )
 
 
+def _job(**attrs):
+    """Build a lightweight stand-in for an RQ job."""
+    return SimpleNamespace(**attrs)
+
+
+# Shared read-only job; _build_job_context never mutates it
+_EMPTY_JOB = _job()
+
+
 class TestRQHelpers:
     def test_sanitize_args_basic(self):
         args = ("arg1", "arg2", 123)
@@ -36,16 +46,25 @@ class TestRQHelpers:
         result = _sanitize_kwargs(kwargs)
         assert result == {"key1": "value1", "key2": "123"}
 
+    def test_sanitize_pair(self):
+        args, kwargs = _sanitize_pair(("arg1", 123), {"key": 456})
+        assert args == ["arg1", "123"]
+        assert kwargs == {"key": "456"}
+
+    def test_sanitize_pair_handles_missing_values(self):
+        assert _sanitize_pair(None, None) == ([], {})
+
     def test_build_job_context_basic(self):
-        job = MagicMock()
-        job.id = "job-123"
-        job.func_name = "my_task"
-        job.origin = "default"
-        job.description = "A test job"
-        job.args = ("arg1",)
-        job.kwargs = {"key": "value"}
-        job.retries_left = 3
-        job.enqueued_at = "2024-01-01T00:00:00"
+        job = _job(
+            id="job-123",
+            func_name="my_task",
+            origin="default",
+            description="A test job",
+            args=("arg1",),
+            kwargs={"key": "value"},
+            retries_left=3,
+            enqueued_at="2024-01-01T00:00:00",
+        )
 
         context = _build_job_context(job)
 
@@ -58,23 +77,27 @@ class TestRQHelpers:
         assert "job_kwargs" in context
 
     def test_build_job_context_handles_missing_attributes(self):
-        job = MagicMock(spec=[])  # Empty spec means no attributes
+        job = _EMPTY_JOB  # No attributes
         context = _build_job_context(job)
         assert context == {}
 
+    def test_build_job_context_keeps_attributes_set_to_none(self):
+        job = _job(id="job-123", description=None)
+        context = _build_job_context(job)
+        assert context == {"job_id": "job-123", "job_description": None}
+
 
 class TestRQExceptionHandler:
     def setup_method(self):
         checkend.reset()
         Testing.setup()
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
 
     def teardown_method(self):
         checkend.reset()
         Testing.teardown()
 
     def test_exception_handler_captures_error(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Simulate what rq_exception_handler does
         job_id = "job-123"
         job_func = "failing_task"
@@ -86,20 +109,16 @@ class TestRQExceptionHandler:
             "job_func": job_func,
             "queue": queue,
         }
-        checkend.set_context(context)
 
         exc = ValueError("Job failed")
-        checkend.notify(exc)
-        checkend.clear()
+        checkend.notify_with_context(exc, context)
 
         assert Testing.has_notices()
-        notice = Testing.notices()[-1]
+        notice = Testing.last_notice()
         assert notice.error_class == "ValueError"
         assert notice.message == "Job failed"
 
     def test_exception_handler_sets_context(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Simulate what rq_exception_handler does
         checkend.clear()
         context = {
@@ -112,7 +131,7 @@ class TestRQExceptionHandler:
         exc = RuntimeError("Something went wrong")
         checkend.notify(exc)
 
-        notice = Testing.notices()[-1]
+        notice = Testing.last_notice()
         assert notice.context.get("job_id") == "job-456"
         assert notice.context.get("job_func") == "my_job"
         assert notice.context.get("queue") == "high-priority"
@@ -120,13 +139,10 @@ class TestRQExceptionHandler:
         checkend.clear()
 
     def test_exception_handler_clears_context_after(self):
-        checkend.configure(api_key="test-key", enabled=True, async_send=False)
-
         # Set some pre-existing context
         checkend.set_context({"pre_existing": "data"})
 
-        job = MagicMock()
-        job.id = "job-789"
+        job = _job(id="job-789")
 
         exc = ValueError("Error")
 
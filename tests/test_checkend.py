@@ -42,6 +42,19 @@ class TestCheckend:
         notices = Testing.notices()
         assert notices[0].context["order_id"] == 123
 
+    def test_notify_with_context_merges_and_clears(self):
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
+        checkend.set_context({"request_id": "req-1"})
+        checkend.set_user({"id": "user-1"})
+
+        checkend.notify_with_context(ValueError("Test"), {"order_id": 123})
+
+        notice = Testing.last_notice()
+        assert notice.context == {"request_id": "req-1", "order_id": 123}
+        assert notice.user["id"] == "user-1"
+        assert checkend.get_context() == {}
+        assert checkend.get_user() == {}
+
     def test_notify_with_user(self):
         checkend.configure(api_key="test-key", enabled=True, async_send=False)
 
@@ -109,6 +122,15 @@ class TestCheckend:
         assert context["key1"] == "value1"
         assert context["key2"] == "value2"
 
+    def test_set_context_merges_without_mutating_previous(self):
+        checkend.set_context({"a": 1})
+        snapshot = checkend._context_var.get()
+
+        checkend.set_context({"b": 2})
+
+        assert checkend.get_context() == {"a": 1, "b": 2}
+        assert snapshot == {"a": 1}
+
     def test_set_and_get_user(self):
         checkend.set_user({"id": "user-1", "email": "test@example.com"})
 
@@ -134,6 +156,17 @@ class TestCheckend:
         assert checkend.get_user() == {}
         assert checkend.get_request() == {}
 
+    def test_replace_context_discards_previous_data(self):
+        checkend.set_context({"old": "value"})
+        checkend.set_user({"id": "user-1"})
+        checkend.set_request({"url": "https://example.com"})
+
+        checkend.replace_context({"new": "value"})
+
+        assert checkend.get_context() == {"new": "value"}
+        assert checkend.get_user() == {}
+        assert checkend.get_request() == {}
+
     def test_context_merged_into_notice(self):
         checkend.configure(api_key="test-key", enabled=True, async_send=False)
         checkend.set_context({"global_key": "global_value"})
@@ -234,3 +267,15 @@ class TestTesting:
         assert Testing.has_notices()
         Testing.clear_notices()
         assert not Testing.has_notices()
+
+    def test_last_notice_returns_most_recent(self):
+        Testing.setup()
+        checkend.configure(api_key="test-key", enabled=True, async_send=False)
+
+        assert Testing.last_notice() is None
+
+        checkend.notify(ValueError("First"))
+        checkend.notify(RuntimeError("Second"))
+
+        assert Testing.first_notice().error_class == "ValueError"
+        assert Testing.last_notice().error_class == "RuntimeError"